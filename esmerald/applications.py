@@ -1959,6 +1959,9 @@ class Application(BaseLilya):
             if value or not getattr(self.openapi_config, name, None):
                 setattr(self.openapi_config, name, value)
 
+        # The routing changed, the cached schema needs to be generated again.
+        self.openapi_schema = None
+
         if self.enable_openapi:
             set_value(self.title, "title")
             set_value(self.version, "version")
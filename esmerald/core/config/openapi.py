@@ -364,23 +364,28 @@ class OpenAPIConfig(BaseModel):
     ] = None
 
     def openapi(self, app: Any) -> dict[str, Any]:
-        """Loads the OpenAPI routing schema"""
-        openapi_schema = get_openapi(
-            app=app,
-            title=self.title,
-            version=self.version,
-            openapi_version=self.openapi_version,
-            summary=self.summary,
-            description=self.description,
-            routes=app.routes,
-            tags=self.tags,
-            servers=self.servers,
-            terms_of_service=self.terms_of_service,
-            contact=self.contact,
-            license=self.license,
-            webhooks=self.webhooks,
-        )
-        app.openapi_schema = openapi_schema
+        """
+        Loads the OpenAPI routing schema.
+
+        The schema is generated once and cached in `app.openapi_schema` until the
+        application routing changes.
+        """
+        if app.openapi_schema is None:
+            app.openapi_schema = get_openapi(
+                app=app,
+                title=self.title,
+                version=self.version,
+                openapi_version=self.openapi_version,
+                summary=self.summary,
+                description=self.description,
+                routes=app.routes,
+                tags=self.tags,
+                servers=self.servers,
+                terms_of_service=self.terms_of_service,
+                contact=self.contact,
+                license=self.license,
+                webhooks=self.webhooks,
+            )
         return cast(dict[str, Any], app.openapi_schema)
 
     def enable(self, app: Any) -> None:
@@ -397,6 +402,7 @@ class OpenAPIConfig(BaseModel):
                     if root_path and self.root_path_in_servers:
                         self.servers.insert(0, {"url": root_path})
                         server_urls.add(root_path)
+                        app.openapi_schema = None
                 return JSONResponse(self.openapi(app))
 
             app.add_route(
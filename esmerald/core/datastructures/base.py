@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from http.cookies import SimpleCookie
+from http.cookies import _getdate, _quote
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -25,7 +25,7 @@ from lilya.datastructures import (
     URLPath as URLPath,  # noqa
 )
 from lilya.responses import Response as LilyaResponse  # noqa
-from pydantic import BaseModel, ConfigDict, field_validator  # noqa
+from pydantic import BaseModel, ConfigDict, Field  # noqa
 from pydantic._internal._schema_generation_shared import (  # noqa
     GetJsonSchemaHandler as GetJsonSchemaHandler,
 )
@@ -91,23 +91,44 @@ class Cookie(BaseModel):
     samesite: Literal["lax", "strict", "none"] = "lax"
     description: Optional[str] = None
 
-    def to_header(self, **kwargs: Any) -> str:
-        simple_cookie: SimpleCookie = SimpleCookie()
-        simple_cookie[self.key] = self.value or ""
+    @classmethod
+    def build(cls, **kwargs: Any) -> "Cookie":
+        """
+        Builds a cookie from already trusted values without running the validation.
+        """
+        return cls.model_construct(**kwargs)
+
+    def to_header(self, header: str = "Set-Cookie:", **kwargs: Any) -> str:
+        """
+        Builds the `Set-Cookie` header string for the cookie.
+
+        The output matches the one generated by `http.cookies.SimpleCookie`
+        (attributes sorted by name) but it is assembled directly from the
+        fields, skipping the `SimpleCookie` and `model_dump()` roundtrip.
+        """
+        parts = [f"{self.key}={_quote(self.value or '')}"]
+        if self.domain:
+            parts.append(f"Domain={self.domain}")
+        if self.expires is not None:
+            parts.append(f"expires={_getdate(self.expires)}")
+        if self.httponly:
+            parts.append("HttpOnly")
         if self.max_age:
-            simple_cookie[self.key]["max-age"] = self.max_age
-        cookie_dict = self.model_dump()
-        for key in ["expires", "path", "domain", "secure", "httponly", "samesite"]:
-            if cookie_dict[key] is not None:
-                simple_cookie[self.key][key] = cookie_dict[key]
-        return simple_cookie.output(**kwargs).strip()
+            parts.append(f"Max-Age={self.max_age}")
+        if self.path:
+            parts.append(f"Path={self.path}")
+        if self.samesite:
+            parts.append(f"SameSite={self.samesite}")
+        if self.secure:
+            parts.append("Secure")
+        return f"{header} {'; '.join(parts)}".strip()
 
 
 class ResponseContainer(BaseModel, ABC, Generic[R]):
     model_config = ConfigDict(arbitrary_types_allowed=True)
     background: Optional[Union[BackgroundTask, BackgroundTasks]] = None
-    headers: dict[str, Any] = {}
-    cookies: list[Cookie] = []
+    headers: dict[str, Any] = Field(default_factory=dict)
+    cookies: list[Cookie] = Field(default_factory=list)
     status_code: Optional[int] = None
 
     @abstractmethod
@@ -124,7 +145,9 @@ class ResponseContainer(BaseModel, ABC, Generic[R]):
 class ResponseHeader(BaseModel):
     value: Optional[Any] = None
 
-    @field_validator("value")  # type: ignore
-    def validate_value(cls, value: Any, values: dict[str, Any]) -> Any:
-        if value is not None:
-            return value
+    @classmethod
+    def build(cls, **kwargs: Any) -> "ResponseHeader":
+        """
+        Builds a response header from already trusted values without running the validation.
+        """
+        return cls.model_construct(**kwargs)
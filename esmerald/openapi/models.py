@@ -1,7 +1,15 @@
 from typing import Any, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
-from typing_extensions import Literal
+import pydantic
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+    model_validator,
+)
+from typing_extensions import Annotated, Literal
 
 from esmerald.openapi.enums import APIKeyIn, SecuritySchemeType
 from esmerald.openapi.schemas.v3_1_0.contact import Contact as Contact
@@ -35,9 +43,13 @@ from esmerald.openapi.schemas.v3_1_0.server_variable import ServerVariable as Se
 from esmerald.openapi.schemas.v3_1_0.tag import Tag as Tag
 from esmerald.openapi.schemas.v3_1_0.xml import XML as XML
 
+SecuritySchemeTypeLiteral = Literal["apiKey", "http", "mutualTLS", "oauth2", "openIdConnect"]
+
 
 class APIKey(SecurityScheme):
-    type: Literal["apiKey", "http", "mutualTLS", "oauth2", "openIdConnect"] = Field(
+    model_config = ConfigDict(frozen=True)
+
+    type: SecuritySchemeTypeLiteral = Field(
         default=SecuritySchemeType.apiKey.value,
         alias="type",
     )
@@ -46,7 +58,9 @@ class APIKey(SecurityScheme):
 
 
 class HTTPBase(SecurityScheme):
-    type: Literal["apiKey", "http", "mutualTLS", "oauth2", "openIdConnect"] = Field(
+    model_config = ConfigDict(frozen=True)
+
+    type: SecuritySchemeTypeLiteral = Field(
         default=SecuritySchemeType.http.value,
         alias="type",
     )
@@ -59,18 +73,20 @@ class HTTPBearer(HTTPBase):
 
 
 class OAuthFlow(OpenOAuthFlow):
-    scopes: dict[str, str] = {}
+    scopes: dict[str, str] = Field(default_factory=dict)
 
 
 class OAuth2(SecurityScheme):
-    type: Literal["apiKey", "http", "mutualTLS", "oauth2", "openIdConnect"] = Field(
-        default=SecuritySchemeType.oauth2.value, alias="type"
-    )
+    model_config = ConfigDict(frozen=True)
+
+    type: SecuritySchemeTypeLiteral = Field(default=SecuritySchemeType.oauth2.value, alias="type")
     flows: OAuthFlows
 
 
 class OpenIdConnect(SecurityScheme):
-    type: Literal["apiKey", "http", "mutualTLS", "oauth2", "openIdConnect"] = Field(
+    model_config = ConfigDict(frozen=True)
+
+    type: SecuritySchemeTypeLiteral = Field(
         default=SecuritySchemeType.openIdConnect.value, alias="type"
     )
     openIdConnectUrl: str
@@ -84,10 +100,73 @@ class SecurityBase(BaseModel):
     scheme_name: Optional[str] = None
 
 
-SecuritySchemeUnion = Union[APIKey, HTTPBase, OAuth2, OpenIdConnect, HTTPBearer]
-
-
-class Components(BaseModel):
+def _get_security_scheme_tag(value: Any) -> Optional[str]:
+    """
+    Picks the concrete security scheme for the `SecuritySchemeUnion`.
+
+    The `type` selects the model directly, apart from `http` where the `scheme`
+    tells apart the `HTTPBearer` from the generic `HTTPBase`.
+    """
+    if isinstance(value, dict):
+        scheme_type = value.get("type")
+        scheme = value.get("scheme")
+    else:
+        scheme_type = getattr(value, "type", None)
+        scheme = getattr(value, "scheme", None)
+
+    if scheme_type is None:
+        return None
+    if str(scheme_type) == SecuritySchemeType.http.value and scheme == "bearer":
+        return "bearer"
+    return str(scheme_type)
+
+
+SecuritySchemeUnion = Annotated[
+    Union[
+        Annotated[APIKey, pydantic.Tag(SecuritySchemeType.apiKey.value)],
+        Annotated[HTTPBase, pydantic.Tag(SecuritySchemeType.http.value)],
+        Annotated[HTTPBearer, pydantic.Tag("bearer")],
+        Annotated[OAuth2, pydantic.Tag(SecuritySchemeType.oauth2.value)],
+        Annotated[OpenIdConnect, pydantic.Tag(SecuritySchemeType.openIdConnect.value)],
+    ],
+    pydantic.Discriminator(_get_security_scheme_tag),
+]
+
+
+class SpecificationExtensions(BaseModel):
+    """
+    Keeps the OpenAPI specification extensions (`x-*` keys) in an explicit
+    `extensions` field while any other unknown key is ignored.
+    """
+
+    extensions: dict[str, Any] = Field(default_factory=dict, exclude=True)
+
+    model_config = ConfigDict(extra="ignore")
+
+    @model_validator(mode="before")
+    @classmethod
+    def collect_extensions(cls, values: Any) -> Any:
+        if not isinstance(values, dict) or not any(
+            isinstance(key, str) and key.startswith("x-") for key in values
+        ):
+            return values
+
+        values = dict(values)
+        extensions = dict(values.get("extensions") or {})
+        for key in [key for key in values if isinstance(key, str) and key.startswith("x-")]:
+            extensions[key] = values.pop(key)
+        values["extensions"] = extensions
+        return values
+
+    @model_serializer(mode="wrap")
+    def serialize_extensions(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        data: dict[str, Any] = handler(self)
+        if self.extensions:
+            data.update(self.extensions)
+        return data
+
+
+class Components(SpecificationExtensions):
     schemas: Optional[dict[str, Union[Schema, Reference]]] = None
     responses: Optional[dict[str, Union[Response, Reference]]] = None
     parameters: Optional[dict[str, Union[Parameter, Reference]]] = None
@@ -99,10 +178,8 @@ class Components(BaseModel):
     callbacks: Optional[dict[str, Union[dict[str, PathItem], Reference, Any]]] = None
     pathItems: Optional[dict[str, Union[PathItem, Reference]]] = None
 
-    model_config = ConfigDict(extra="allow")
-
 
-class OpenAPI(BaseModel):
+class OpenAPI(SpecificationExtensions):
     openapi: str
     info: Info
     jsonSchemaDialect: Optional[str] = None
@@ -113,4 +190,3 @@ class OpenAPI(BaseModel):
     security: Optional[list[dict[str, list[str]]]] = None
     tags: Optional[list[str]] = None
     externalDocs: Optional[ExternalDocumentation] = None
-    model_config = ConfigDict(extra="allow")
@@ -21,7 +21,6 @@ from lilya.middleware import DefineMiddleware
 from lilya.routing import BasePath
 from lilya.status import HTTP_422_UNPROCESSABLE_ENTITY
 from lilya.transformers import TRANSFORMER_TYPES
-from orjson import loads
 from pydantic import AnyUrl
 from pydantic.fields import FieldInfo
 from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
@@ -630,5 +629,4 @@ def get_openapi(
         output["tags"] = tags
 
     openapi = OpenAPI(**output)
-    model_dump = openapi.model_dump_json(by_alias=True, exclude_none=True)
-    return cast(dict[str, Any], loads(model_dump))
+    return openapi.model_dump(mode="json", by_alias=True, exclude_none=True)
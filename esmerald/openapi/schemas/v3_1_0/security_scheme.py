@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from pydantic import AnyUrl, BaseModel, ConfigDict, Field
 from typing_extensions import Literal
@@ -76,6 +76,13 @@ class SecurityScheme(BaseModel):
     An optional model to be used for the security scheme.
     """
 
+    @classmethod
+    def build(cls, **kwargs: Any) -> "SecurityScheme":
+        """
+        Builds the security scheme from already trusted values without running the validation.
+        """
+        return cls.model_construct(**kwargs)
+
     model_config = ConfigDict(
         extra="ignore",
         populate_by_name=True,
@@ -81,6 +81,19 @@ T = TypeVar("T", bound="Dispatcher")
 _empty: tuple[Any, ...] = ()
 
 
+def _get_injector_identity(injector: Inject) -> Any:
+    """
+    Returns the hashable identity used by `Inject.__eq__` or None when the
+    dependency is not hashable.
+    """
+    identity = (type(injector), injector.dependency, injector.use_cache)
+    try:
+        hash(identity)
+    except TypeError:
+        return None
+    return identity
+
+
 class PathParameterSchema(TypedDict):
     name: str
     full: str
@@ -554,8 +567,14 @@ class Dispatcher(BaseSignature, BaseDispatcher, OpenAPIDefinitionMixin):
         - The Signature object is created using the `from_callable` method of the `Signature` class.
         - The `from_callable` method takes a callable object (in this case, the handler function) as input and returns a Signature object.
         - The Signature object can be used to inspect the parameters and return type of the handler function.
+        - The Signature is computed once per handler function and reused until `fn` is replaced.
         """
-        return Signature.from_callable(cast(AnyCallable, self.fn))
+        fn = cast(AnyCallable, self.fn)
+        cached: tuple[AnyCallable, Signature] | None = getattr(self, "_handler_signature", None)
+        if cached is None or cached[0] is not fn:
+            cached = (fn, Signature.from_callable(fn))
+            self._handler_signature = cached
+        return cached[1]
 
     @property
     def path_parameters(self) -> Set[str]:
@@ -660,7 +679,8 @@ class Dispatcher(BaseSignature, BaseDispatcher, OpenAPIDefinitionMixin):
         while current:
             levels.append(current)
             current = current.parent
-        return list(reversed(levels))
+        levels.reverse()
+        return levels
 
     def get_lookup_path(self, ignore_first: bool = True) -> list[str]:
         """
@@ -686,7 +706,8 @@ class Dispatcher(BaseSignature, BaseDispatcher, OpenAPIDefinitionMixin):
                     names.append(current.name)
             current = current.parent
             counter += 1
-        return list(reversed(names))
+        names.reverse()
+        return names
 
     @property
     def dependency_names(self) -> Set[str]:
@@ -708,8 +729,11 @@ class Dispatcher(BaseSignature, BaseDispatcher, OpenAPIDefinitionMixin):
         - If no dependencies are defined in any of the parent levels, an empty set will be returned.
         - The dependencies are collected from all parent levels, ensuring that there are no duplicate dependency names in the final set.
         """
-        level_dependencies = (level.dependencies or {} for level in self.parent_levels)
-        return {name for level in level_dependencies for name in level.keys()}
+        names: Set[str] = set()
+        for level in self.parent_levels:
+            if level.dependencies:
+                names.update(level.dependencies)
+        return names
 
     def get_dependencies(self) -> Dependencies:
         """
@@ -741,15 +765,22 @@ class Dispatcher(BaseSignature, BaseDispatcher, OpenAPIDefinitionMixin):
 
         if not self._dependencies or self._dependencies is Void:
             self._dependencies: Dependencies = {}
+            # Injectors can only be equal when they share the same identity, so the
+            # full uniqueness scan is only needed when the identity was already seen.
+            seen_injectors: Set[Any] = set()
             for level in self.parent_levels:
                 for key, value in (level.dependencies or {}).items():
                     if not isinstance(value, Inject):
                         value = Inject(value)
-                    self.is_unique_dependency(
-                        dependencies=self._dependencies,
-                        key=key,
-                        injector=value,
-                    )
+                    identity = _get_injector_identity(value)
+                    if identity is None or identity in seen_injectors:
+                        self.is_unique_dependency(
+                            dependencies=self._dependencies,
+                            key=key,
+                            injector=value,
+                        )
+                    if identity is not None:
+                        seen_injectors.add(identity)
                     self._dependencies[key] = value  # type: ignore[assignment]
         return self._dependencies
 
@@ -0,0 +1,22 @@
+from esmerald import get
+
+
+def test_handler_signature_is_reused() -> None:
+    @get()
+    def home() -> str: ...
+
+    assert home.handler_signature is home.handler_signature
+    assert home.handler_signature.return_annotation is str
+
+
+def test_handler_signature_follows_fn() -> None:
+    @get()
+    def home() -> str: ...
+
+    def other() -> int: ...
+
+    assert home.handler_signature.return_annotation is str
+
+    home.fn = other
+
+    assert home.handler_signature.return_annotation is int
@@ -0,0 +1,47 @@
+from typing import Dict
+
+from esmerald import Esmerald, Gateway, get
+from esmerald.testclient import EsmeraldTestClient
+from tests.settings import TestSettings
+
+
+@get("/bar")
+async def bar() -> Dict[str, str]:
+    return {"hello": "world"}
+
+
+@get("/foo")
+async def foo() -> Dict[str, str]:
+    return {"hello": "world"}
+
+
+def test_openapi_schema_is_cached(test_client_factory):
+    app = Esmerald(
+        routes=[Gateway(handler=bar)], enable_openapi=True, settings_module=TestSettings
+    )
+    client = EsmeraldTestClient(app)
+
+    response = client.get("/openapi.json")
+    assert response.status_code == 200, response.text
+
+    schema = app.openapi_schema
+    assert schema is not None
+
+    response = client.get("/openapi.json")
+    assert response.status_code == 200, response.text
+    assert app.openapi_schema is schema
+
+
+def test_openapi_schema_is_regenerated_when_routes_change(test_client_factory):
+    app = Esmerald(
+        routes=[Gateway(handler=bar)], enable_openapi=True, settings_module=TestSettings
+    )
+    client = EsmeraldTestClient(app)
+
+    response = client.get("/openapi.json")
+    assert list(response.json()["paths"]) == ["/bar"]
+
+    app.add_route("/", handler=foo)
+
+    response = client.get("/openapi.json")
+    assert list(response.json()["paths"]) == ["/bar", "/foo"]
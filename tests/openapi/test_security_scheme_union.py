@@ -0,0 +1,42 @@
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from esmerald.openapi.models import (
+    APIKey,
+    HTTPBase,
+    HTTPBearer,
+    OAuth2,
+    OpenIdConnect,
+    SecuritySchemeUnion,
+)
+
+adapter = TypeAdapter(SecuritySchemeUnion)
+
+
+def test_security_scheme_union_picks_model_by_type():
+    assert isinstance(
+        adapter.validate_python({"type": "apiKey", "in": "header", "name": "key"}), APIKey
+    )
+    assert isinstance(adapter.validate_python({"type": "oauth2", "flows": {}}), OAuth2)
+    assert isinstance(
+        adapter.validate_python({"type": "openIdConnect", "openIdConnectUrl": "/openid"}),
+        OpenIdConnect,
+    )
+
+
+def test_security_scheme_union_http_uses_scheme():
+    basic = adapter.validate_python({"type": "http", "scheme": "basic"})
+    bearer = adapter.validate_python({"type": "http", "scheme": "bearer"})
+
+    assert type(basic) is HTTPBase
+    assert type(bearer) is HTTPBearer
+
+
+def test_security_schemes_are_frozen():
+    scheme = HTTPBearer(bearerFormat="JWT")
+
+    with pytest.raises(ValidationError):
+        scheme.bearerFormat = "opaque"
+
+    assert scheme == HTTPBearer(bearerFormat="JWT")
+    assert hash(scheme) == hash(HTTPBearer(bearerFormat="JWT"))
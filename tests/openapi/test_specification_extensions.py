@@ -0,0 +1,18 @@
+from esmerald.openapi.models import OpenAPI
+
+
+def test_openapi_keeps_specification_extensions():
+    openapi = OpenAPI(
+        openapi="3.1.0",
+        info={"title": "Esmerald", "version": "1.0.0"},
+        components={"schemas": {}, "x-internal": True},
+        **{"x-logo": {"url": "https://esmerald.dev/logo.png"}, "unknown": "ignored"},
+    )
+
+    assert openapi.extensions == {"x-logo": {"url": "https://esmerald.dev/logo.png"}}
+    assert openapi.model_dump(by_alias=True, exclude_none=True) == {
+        "openapi": "3.1.0",
+        "info": {"title": "Esmerald", "version": "1.0.0"},
+        "components": {"schemas": {}, "x-internal": True},
+        "x-logo": {"url": "https://esmerald.dev/logo.png"},
+    }
@@ -40,3 +40,10 @@ def test_cookie_with_max_age_as_header() -> None:
 def test_cookie_as_header_without_header_name() -> None:
     cookie = Cookie(key="key")
     assert cookie.to_header(header="") == 'key=""; Path=/; SameSite=lax'
+
+
+def test_cookie_build_skips_validation() -> None:
+    cookie = Cookie.build(key="key", value="value")
+
+    assert cookie == Cookie(key="key", value="value")
+    assert cookie.to_header() == "Set-Cookie: key=value; Path=/; SameSite=lax"